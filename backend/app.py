@@ -14,16 +14,22 @@ FastAPI features demonstrated:
 - Built-in error handling
 """
 
+import json
+import math
 import os
-from typing import List, Union
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, ValidationError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.math_operations import (
-    calculate_stats,
+    _calculate_stats_trusted,
     factorial,
     fibonacci,
     is_prime,
@@ -31,6 +37,108 @@ from src.math_operations import (
     square,
 )
 
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, a Rust-based encoder.
+
+    Defined here rather than imported from fastapi.responses, whose
+    ORJSONResponse is deprecated in newer FastAPI releases. orjson cannot
+    encode integers wider than 64 bits (e.g. factorial(25)), so such content
+    falls back to the standard library encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(
+                content,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(content)
+
+
+class PureGetCacheMiddleware:
+    """
+    ASGI middleware caching successful GET responses of pure endpoints.
+
+    The math GET endpoints always return the same response for the same path,
+    so repeated requests are answered from memory without running the route.
+    The cache is per process and holds at most ``max_entries`` responses,
+    evicting the least recently used. Bodies larger than ``max_body_bytes``
+    (e.g. /fibonacci/1000) are not cached, so memory stays bounded.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        prefixes: Tuple[str, ...],
+        max_entries: int = 1024,
+        max_body_bytes: int = 4096,
+    ) -> None:
+        self.app = app
+        self.prefixes = prefixes
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        self.cache: "OrderedDict[str, Tuple[int, List[Tuple[bytes, bytes]], bytes]]"
+        self.cache = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = scope["path"]
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+            status, headers, body = cached
+            # Send a copy: the outer CORS middleware edits the headers in place
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": status,
+                    "headers": list(headers),
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        response_status = 0
+        response_headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        size = 0
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal response_status, response_headers, size
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+                if response_status == 200:
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"cache-control", b"public, max-age=86400"),
+                    ]
+                    # Copy before sending: the outer CORS middleware adds the
+                    # requesting origin's headers to this same message
+                    response_headers = list(message["headers"])
+            elif message["type"] == "http.response.body" and response_status == 200:
+                body = message.get("body", b"")
+                size += len(body)
+                if size <= self.max_body_bytes:
+                    chunks.append(body)
+                if not message.get("more_body", False) and size <= self.max_body_bytes:
+                    self.cache[key] = (200, response_headers, b"".join(chunks))
+                    if len(self.cache) > self.max_entries:
+                        self.cache.popitem(last=False)
+            await send(message)
+
+        await self.app(scope, receive, send_and_record)
+
+
 # Create FastAPI app with metadata
 app = FastAPI(
     title="Mathematical Operations API",
@@ -38,24 +146,38 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # Rust-based encoder, faster than json
 )
 
-# Configure CORS origins from environment variable
-cors_origins = os.getenv(
-    "CORS_ORIGINS",
-    (
-        "http://localhost:3000,http://localhost:5173,"
-        "http://127.0.0.1:3000,http://127.0.0.1:5173"
-    ),
-).split(",")
+# Configure CORS origins from environment variable (parsed once at import)
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS",
+        (
+            "http://localhost:3000,http://localhost:5173,"
+            "http://127.0.0.1:3000,http://127.0.0.1:5173"
+        ),
+    ).split(",")
+    if origin.strip()
+)
 
-# Add CORS middleware to allow frontend requests
+# Cache responses of the deterministic GET endpoints. Added before CORS so
+# it runs inside it and cached responses still get per-origin CORS headers.
+app.add_middleware(
+    PureGetCacheMiddleware,
+    prefixes=("/square/", "/factorial/", "/fibonacci/", "/prime/"),
+)
+
+# Add CORS middleware to allow frontend requests. Preflight OPTIONS requests
+# are answered by the middleware itself, and listing the only header the
+# frontend sends avoids echoing arbitrary request headers back.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[origin.strip() for origin in cors_origins],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Content-Type"],
 )
 
 
@@ -75,7 +197,7 @@ class StatsRequest(BaseModel):
     )
 
 
-# Pydantic models for response validation
+# Pydantic models documenting responses (used for the OpenAPI schema)
 class HealthResponse(BaseModel):
     """Response model for health check."""
 
@@ -161,12 +283,97 @@ class ErrorResponse(BaseModel):
     success: bool = Field(default=False, description="Always false for errors")
 
 
-@app.get("/", response_model=APIInfoResponse)
-async def root() -> APIInfoResponse:
+def _response_schema(model: type[BaseModel]) -> dict[int | str, dict[str, Any]]:
     """
-    API root endpoint providing information about available endpoints.
+    Document a 200 response model in OpenAPI without validating against it.
+
+    Endpoints build their responses themselves, so they pass
+    ``response_model=None`` to skip FastAPI's validation and encoding pass.
+    """
+    return {200: {"model": model}}
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """Whether FastAPI would decode a body with this Content-Type as JSON."""
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type.count("/") != 1:
+        return False
+    maintype, subtype = media_type.split("/")
+    return maintype == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+def _validate_body_slow(
+    model: type[BaseModel], raw: bytes, content_type: Optional[str]
+) -> Any:
+    """
+    Validate a request body the way FastAPI's own body handling does.
+
+    Used when fast JSON validation fails, so clients get the same 422 errors
+    as a ``model``-typed body parameter: ``missing`` for an empty body, the
+    decode offset for malformed JSON and Python-mode validation messages.
+    """
+    data: Any = None
+    if raw:
+        if _is_json_content_type(content_type):
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError as e:
+                raise RequestValidationError(
+                    [
+                        {
+                            "type": "json_invalid",
+                            "loc": ("body", e.pos),
+                            "msg": "JSON decode error",
+                            "input": {},
+                            "ctx": {"error": e.msg},
+                        }
+                    ]
+                ) from e
+        else:
+            data = raw
+    if data is None:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "missing",
+                    "loc": ("body",),
+                    "msg": "Field required",
+                    "input": None,
+                }
+            ]
+        )
+    try:
+        return model.model_validate(data, from_attributes=True)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        ) from e
+
+
+def _ensure_finite(*values: Any) -> None:
+    """
+    Reject inf and NaN results, which JSON cannot represent.
+
+    orjson would encode them as null (e.g. square(1e200)), so they are
+    reported as invalid input instead.
     """
-    return APIInfoResponse(
+    for value in values:
+        if isinstance(value, float) and not math.isfinite(value):
+            raise ValueError("Result is not a finite number")
+
+
+# The root and health responses never change, so they are built, validated
+# and encoded once at import; the handlers just return the cached bytes.
+# This matters for /health, which load balancers and probes call constantly.
+_API_INFO_BYTES = orjson.dumps(
+    APIInfoResponse(
         message="Mathematical Operations API",
         version="1.0.0",
         docs_url="/docs",
@@ -182,19 +389,33 @@ async def root() -> APIInfoResponse:
             "POST /power": "Calculate base^exponent",
             "POST /stats": "Calculate statistics for a list of numbers",
         },
-    )
+    ).model_dump()
+)
+_HEALTH_BYTES = orjson.dumps(
+    HealthResponse(status="healthy", service="math-operations-api").model_dump()
+)
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+@app.get("/", response_model=None, responses=_response_schema(APIInfoResponse))
+async def root() -> Response:
+    """
+    API root endpoint providing information about available endpoints.
+    """
+    return Response(content=_API_INFO_BYTES, media_type="application/json")
+
+
+@app.get("/health", response_model=None, responses=_response_schema(HealthResponse))
+async def health_check() -> Response:
     """
     Health check endpoint to verify API is running.
     """
-    return HealthResponse(status="healthy", service="math-operations-api")
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
-@app.get("/square/{number}", response_model=SquareResponse)
-async def api_square(number: Union[int, float]) -> SquareResponse:
+@app.get(
+    "/square/{number}", response_model=None, responses=_response_schema(SquareResponse)
+)
+async def api_square(number: Union[int, float]) -> ORJSONResponse:
     """
     Calculate the square of a number.
 
@@ -202,13 +423,22 @@ async def api_square(number: Union[int, float]) -> SquareResponse:
     """
     try:
         result = square(number)
-        return SquareResponse(operation="square", input=number, result=result)
+        _ensure_finite(result)
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    return ORJSONResponse(
+        {"operation": "square", "success": True, "input": number, "result": result}
+    )
 
 
-@app.get("/factorial/{number}", response_model=FactorialResponse)
-async def api_factorial(number: int) -> FactorialResponse:
+# CPU-bound endpoints are plain ``def`` so FastAPI runs them in its threadpool
+# instead of blocking the event loop while the computation runs.
+@app.get(
+    "/factorial/{number}",
+    response_model=None,
+    responses=_response_schema(FactorialResponse),
+)
+def api_factorial(number: int) -> ORJSONResponse:
     """
     Calculate the factorial of a non-negative integer.
 
@@ -216,13 +446,24 @@ async def api_factorial(number: int) -> FactorialResponse:
     """
     try:
         result = factorial(number)
-        return FactorialResponse(operation="factorial", input=number, result=result)
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    return ORJSONResponse(
+        {
+            "operation": "factorial",
+            "success": True,
+            "input": number,
+            "result": result,
+        }
+    )
 
 
-@app.get("/fibonacci/{count}", response_model=FibonacciResponse)
-async def api_fibonacci(count: int) -> FibonacciResponse:
+@app.get(
+    "/fibonacci/{count}",
+    response_model=None,
+    responses=_response_schema(FibonacciResponse),
+)
+def api_fibonacci(count: int) -> ORJSONResponse:
     """
     Generate the first N numbers in the Fibonacci sequence.
 
@@ -230,13 +471,22 @@ async def api_fibonacci(count: int) -> FibonacciResponse:
     """
     try:
         result = fibonacci(count)
-        return FibonacciResponse(operation="fibonacci", count=count, sequence=result)
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    return ORJSONResponse(
+        {
+            "operation": "fibonacci",
+            "success": True,
+            "count": count,
+            "sequence": result,
+        }
+    )
 
 
-@app.get("/prime/{number}", response_model=PrimeResponse)
-async def api_is_prime(number: int) -> PrimeResponse:
+@app.get(
+    "/prime/{number}", response_model=None, responses=_response_schema(PrimeResponse)
+)
+def api_is_prime(number: int) -> ORJSONResponse:
     """
     Check if a number is prime.
 
@@ -244,13 +494,20 @@ async def api_is_prime(number: int) -> PrimeResponse:
     """
     try:
         result = is_prime(number)
-        return PrimeResponse(operation="is_prime", input=number, is_prime=result)
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    return ORJSONResponse(
+        {
+            "operation": "is_prime",
+            "success": True,
+            "input": number,
+            "is_prime": result,
+        }
+    )
 
 
-@app.post("/power", response_model=PowerResponse)
-async def api_power(request: PowerRequest) -> PowerResponse:
+@app.post("/power", response_model=None, responses=_response_schema(PowerResponse))
+async def api_power(request: PowerRequest) -> ORJSONResponse:
     """
     Calculate base raised to the power of exponent.
 
@@ -260,18 +517,38 @@ async def api_power(request: PowerRequest) -> PowerResponse:
     """
     try:
         result = power(request.base, request.exponent)
-        return PowerResponse(
-            operation="power",
-            base=request.base,
-            exponent=request.exponent,
-            result=result,
-        )
+        if isinstance(result, complex):
+            # e.g. a negative base with a fractional exponent
+            raise ValueError("Result is not a real number")
+        _ensure_finite(result)
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    return ORJSONResponse(
+        {
+            "operation": "power",
+            "success": True,
+            "base": request.base,
+            "exponent": request.exponent,
+            "result": result,
+        }
+    )
 
 
-@app.post("/stats", response_model=StatsResponse)
-async def api_calculate_stats(request: StatsRequest) -> StatsResponse:
+@app.post(
+    "/stats",
+    response_model=None,
+    responses=_response_schema(StatsResponse),
+    # The body is validated by hand below, so document it explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": StatsRequest.model_json_schema()}
+            },
+        }
+    },
+)
+async def api_calculate_stats(request: Request) -> ORJSONResponse:
     """
     Calculate basic statistics for a list of numbers.
 
@@ -280,22 +557,41 @@ async def api_calculate_stats(request: StatsRequest) -> StatsResponse:
 
     Returns count, mean, median, min, max, and sum.
     """
+    # Validate the raw JSON bytes in one step in pydantic-core, instead of
+    # FastAPI decoding them with json.loads and validating the Python objects.
+    # Anything else takes FastAPI's path, so errors keep their usual shape.
+    raw = await request.body()
+    content_type = request.headers.get("content-type")
+    body: Optional[StatsRequest] = None
+    if raw and _is_json_content_type(content_type):
+        try:
+            body = StatsRequest.model_validate_json(raw)
+        except ValidationError:
+            pass
+    if body is None:
+        body = _validate_body_slow(StatsRequest, raw, content_type)
+
     try:
-        result = calculate_stats(request.numbers)
-        return StatsResponse(
-            operation="calculate_stats",
-            input_numbers=request.numbers,
-            statistics=StatisticsData(**result),
-        )
+        # StatsRequest has already validated a non-empty list of numbers
+        result = _calculate_stats_trusted(body.numbers)
+        _ensure_finite(*result.values())
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    return ORJSONResponse(
+        {
+            "operation": "calculate_stats",
+            "success": True,
+            "input_numbers": body.numbers,
+            "statistics": result,
+        }
+    )
 
 
 # Custom exception handler for better error responses
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """Handle unexpected exceptions gracefully."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -324,10 +620,42 @@ if __name__ == "__main__":
     print("Interactive docs available at http://localhost:8000/docs")
     print("Press Ctrl+C to stop the server")
 
+    env = os.getenv("ENV", "development")
+    development = env == "development"
+    # Access logging at info level costs time on every request, so outside
+    # development only warnings and errors are logged unless LOG_LEVEL is set
+    log_level = os.getenv("LOG_LEVEL", "info" if development else "warning")
+
+    if env == "production":
+        # Production: gunicorn pre-forks one Uvicorn worker per CPU core.
+        # --preload imports this module once before forking so the FastAPI
+        # app and its Pydantic schemas are built a single time and shared
+        # copy-on-write between workers.
+        os.execvp(
+            "gunicorn",
+            [
+                "gunicorn",
+                "app:app",
+                "--worker-class",
+                "uvicorn_worker.UvicornWorker",
+                "--workers",
+                os.getenv("WORKERS", str(os.cpu_count() or 1)),
+                "--preload",
+                "--bind",
+                "0.0.0.0:8000",
+                "--log-level",
+                log_level,
+            ],
+        )
+
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Auto-reload on code changes
-        log_level="info",
+        reload=development,  # Auto-reload on code changes (development only)
+        workers=int(os.getenv("WORKERS", "1")),
+        log_level=log_level,
+        access_log=development,
+        loop="uvloop",  # libuv-based event loop (installed via uvicorn[standard])
+        http="httptools",  # C-accelerated HTTP parser (installed via uvicorn[standard])
     )
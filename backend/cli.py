@@ -18,6 +18,7 @@ Usage:
 
 import argparse
 import sys
+from typing import List, Optional
 
 from src.math_operations import (
     calculate_stats,
@@ -49,27 +50,37 @@ def format_result(operation: str, result, **kwargs):
     print("=" * (len(operation) + 15))
 
 
+def parse_number(value: str):
+    """Parse a numeric argument as int when possible, otherwise as float."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
 def cmd_square(args):
     """Handle square command."""
     try:
-        number = float(args.number) if "." in args.number else int(args.number)
+        number = parse_number(args.number)
         result = square(number)
         format_result("square", result, input=number)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 
 def cmd_power(args):
     """Handle power command."""
     try:
-        base = float(args.base) if "." in args.base else int(args.base)
-        exponent = float(args.exponent) if "." in args.exponent else int(args.exponent)
+        base = parse_number(args.base)
+        exponent = parse_number(args.exponent)
         result = power(base, exponent)
         format_result("power", result, base=base, exponent=exponent)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 
 def cmd_factorial(args):
@@ -79,7 +90,8 @@ def cmd_factorial(args):
         format_result("factorial", result, input=args.number)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 
 def cmd_fibonacci(args):
@@ -89,7 +101,8 @@ def cmd_fibonacci(args):
         format_result("fibonacci", result, count=args.count)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 
 def cmd_prime(args):
@@ -100,30 +113,27 @@ def cmd_prime(args):
         format_result("prime check", f"{args.number} {prime_status}", input=args.number)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 
 def cmd_stats(args):
     """Handle statistics command."""
     try:
-        numbers = []
-        for num_str in args.numbers:
-            # Convert to appropriate numeric type
-            if "." in num_str:
-                numbers.append(float(num_str))
-            else:
-                numbers.append(int(num_str))
+        numbers = [parse_number(num_str) for num_str in args.numbers]
 
         result = calculate_stats(numbers)
         format_result("statistics", result, input_numbers=numbers)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 
 def create_parser():
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
+        prog="cli.py",
         description="Mathematical Operations CLI - Direct access to business logic",
         epilog="Examples:\n"
         "  python cli.py square 5\n"
@@ -182,29 +192,48 @@ def create_parser():
     return parser
 
 
-def main():
-    """Main CLI entry point."""
+# Built once at import so repeated main() calls in one process reuse it
+PARSER = create_parser()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Arguments to parse, excluding the program name; defaults to
+            sys.argv[1:]
+
+    Returns:
+        Process exit code (0 on success)
+    """
     print("Mathematical Operations CLI")
     print("Demonstrating direct access to business logic functions")
     print("(The same functions used by the REST API)")
 
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
 
     # If no arguments provided, show help
-    if len(sys.argv) == 1:
-        parser.print_help()
-        sys.exit(1)
+    if not argv:
+        PARSER.print_help()
+        return 1
+
+    try:
+        args = PARSER.parse_args(argv)
+    except SystemExit as e:
+        # argparse exits after --help (0) or a usage error (2)
+        return e.code if isinstance(e.code, int) else 1
 
     try:
-        args = parser.parse_args()
-        args.func(args)
+        return args.func(args)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
-        sys.exit(1)
+        return 1
     except Exception as e:
         print(f"Unexpected error: {e}")
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
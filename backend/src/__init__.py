@@ -6,14 +6,33 @@ All functions are designed to be pure, testable, and reusable across
 different interfaces (API, CLI, etc.).
 """
 
-from .math_operations import (
-    calculate_stats,
-    factorial,
-    fibonacci,
-    is_prime,
-    power,
-    square,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .math_operations import (
+        calculate_stats,
+        factorial,
+        fibonacci,
+        is_prime,
+        power,
+        square,
+    )
 
 __version__ = "1.0.0"
 __all__ = ["square", "power", "factorial", "fibonacci", "is_prime", "calculate_stats"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import math_operations on first access (PEP 562).
+
+    Importing another submodule such as src.data_parsing then doesn't pay
+    for loading math_operations and NumPy.
+    """
+    if name in __all__:
+        from . import math_operations
+
+        value = getattr(math_operations, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,12 +8,26 @@ coding interviews and data analysis tasks.
 
 import io
 import json
+import math
+import operator
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Union, cast
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Union, cast
 
+import ijson  # type: ignore[import-untyped]
+import orjson
 import pandas as pd  # type: ignore[import-untyped]
 import requests  # type: ignore[import-untyped]
 
+# When enabled, load_csv keeps a Parquet copy next to each CSV it parses and
+# reads that instead while it is newer than the CSV
+_CSV_CACHE_ENABLED = os.getenv("DATA_PARSING_CACHE") == "1"
+
+# orjson reads integers wider than 64 bits as floats; a run of 20+ digits may
+# be one, so load_json parses such files with json to keep them exact
+_WIDE_INT_PATTERN = re.compile(rb"\d{20,}")
+
 
 def load_csv(file_path: Union[str, Path]) -> pd.DataFrame:
     """
@@ -33,10 +47,41 @@ def load_csv(file_path: Union[str, Path]) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    if not _CSV_CACHE_ENABLED:
+        return _parse_csv(path)
+
+    cache_path = path.with_suffix(".cache.parquet")
+    try:
+        if cache_path.stat().st_mtime > path.stat().st_mtime:
+            return pd.read_parquet(cache_path)
+    except Exception:
+        # Missing or unreadable cache: parse the CSV and rewrite it
+        pass
+
+    df = _parse_csv(path)
+    try:
+        df.to_parquet(cache_path, index=False)
+    except Exception:
+        # Caching is best effort, e.g. the directory may be read-only
+        pass
+    return df
+
+
+def _parse_csv(path: Path) -> pd.DataFrame:
+    """Parse a CSV file, raising ValueError if it can't be read."""
+    try:
+        # PyArrow's multi-threaded parser is much faster than the default C
+        # engine on large files and still returns NumPy-backed columns
+        return pd.read_csv(path, engine="pyarrow")
+    except Exception:
+        # PyArrow is stricter (e.g. about short rows), so let the default
+        # engine decide whether the file is really unparseable
+        pass
+
     try:
         return pd.read_csv(path)
     except Exception as e:
-        raise ValueError(f"Failed to parse CSV file {file_path}: {str(e)}") from e
+        raise ValueError(f"Failed to parse CSV file {path}: {str(e)}") from e
 
 
 def load_json(
@@ -60,14 +105,58 @@ def load_json(
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return cast(Union[Dict[str, Any], List[Dict[str, Any]]], json.load(f))
+        data = path.read_bytes()
+        # orjson parses the raw bytes directly and is much faster than json.
+        # It rejects the NaN/Infinity literals json accepts, so files it
+        # can't parse are retried with json before reporting an error.
+        if _WIDE_INT_PATTERN.search(data) is None:
+            try:
+                return cast(
+                    Union[Dict[str, Any], List[Dict[str, Any]]], orjson.loads(data)
+                )
+            except orjson.JSONDecodeError:
+                pass
+        return cast(Union[Dict[str, Any], List[Dict[str, Any]]], json.loads(data))
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON file {file_path}: {str(e)}") from e
     except Exception as e:
         raise ValueError(f"Error reading file {file_path}: {str(e)}") from e
 
 
+def stream_json_records(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of a JSON array file one at a time.
+
+    Unlike load_json, the file is parsed incrementally, so arrays too large
+    to hold in memory can be processed record by record, e.g. with
+    ``pd.DataFrame.from_records(stream_json_records(path))``.
+
+    Args:
+        file_path: Path to a JSON file whose top level is an array of objects
+
+    Returns:
+        Iterator over the objects in the array, as dicts
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file cannot be parsed as JSON
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    # Checked above rather than in the generator so a missing file fails
+    # immediately instead of on first iteration
+    def records() -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, "rb") as f:
+                yield from ijson.items(f, "item", use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Failed to parse JSON file {file_path}: {str(e)}") from e
+
+    return records()
+
+
 def fetch_and_parse_url(
     url: str, format: str = "auto"
 ) -> Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]]:
@@ -118,9 +207,7 @@ def fetch_and_parse_url(
 
     try:
         if format_lower == "json":
-            return cast(
-                Union[Dict[str, Any], List[Dict[str, Any]]], response.json()
-            )
+            return cast(Union[Dict[str, Any], List[Dict[str, Any]]], response.json())
         elif format_lower == "csv":
             return pd.read_csv(io.StringIO(response.text))
         else:
@@ -186,18 +273,33 @@ def dataframe_summary(df: pd.DataFrame) -> Dict[str, Any]:
         "dtypes": df.dtypes.astype(str).to_dict(),
     }
 
-    # Add statistics for numeric columns
+    # Add statistics for numeric columns. Only the reported statistics are
+    # computed; describe() would also sort each column for its percentiles.
     numeric_cols = df.select_dtypes(include=["number"]).columns
     if len(numeric_cols) > 0:
-        summary["numeric_stats"] = df[numeric_cols].describe().to_dict()
+        summary["numeric_stats"] = (
+            df[numeric_cols].agg(["count", "mean", "std", "min", "max"]).to_dict()
+        )
 
-    # Add null counts
-    null_counts = df.isnull().sum()
+    # Add null counts (df.count() avoids materializing a boolean mask frame)
+    null_counts = len(df) - df.count()
     summary["null_counts"] = null_counts[null_counts > 0].to_dict()
 
     return summary
 
 
+# filter_dataframe conditions mapped to the function building their row mask
+_COMPARISON_OPS: Dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "in": pd.Series.isin,
+}
+
+
 def filter_dataframe(
     df: pd.DataFrame, column: str, condition: str, value: Any
 ) -> pd.DataFrame:
@@ -221,50 +323,92 @@ def filter_dataframe(
     if column not in df.columns:
         raise ValueError(f"Column '{column}' not found in DataFrame")
 
-    if condition == "==":
-        return df[df[column] == value]
-    elif condition == "!=":
-        return df[df[column] != value]
-    elif condition == ">":
-        return df[df[column] > value]
-    elif condition == "<":
-        return df[df[column] < value]
-    elif condition == ">=":
-        return df[df[column] >= value]
-    elif condition == "<=":
-        return df[df[column] <= value]
-    elif condition == "in":
-        return df[df[column].isin(value)]
+    compare = _COMPARISON_OPS.get(condition)
+    if compare is not None:
+        # numexpr is installed, so pandas evaluates numeric comparisons on
+        # large columns with it; a DataFrame.query string only adds overhead
+        return df[compare(df[column], value)]
     elif condition == "contains":
-        if df[column].dtype == "object":
-            return df[df[column].str.contains(str(value), na=False)]
+        series = df[column]
+        if isinstance(series.dtype, pd.StringDtype):
+            strings = series
+        elif series.dtype == "object":
+            strings = series
+            # Arrow-backed strings use a vectorized substring kernel instead
+            # of a per-row Python loop. Only all-string columns are cast: the
+            # cast would turn other values (e.g. 123) into text that matches.
+            if pd.api.types.infer_dtype(series, skipna=True) == "string":
+                strings = series.astype("string[pyarrow]")
         else:
             raise ValueError(f"Cannot use 'contains' on non-string column '{column}'")
+        # Plain substring match: no regex compilation per call
+        return df[strings.str.contains(str(value), regex=False, na=False)]
     else:
         raise ValueError(f"Unsupported condition: {condition}")
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode values orjson doesn't handle natively, such as pandas timestamps."""
+    if obj is pd.NaT:
+        return None
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
 def save_dataframe(
-    df: pd.DataFrame, file_path: Union[str, Path], format: str = "csv"
+    df: pd.DataFrame, file_path: Union[str, Path, BinaryIO], format: str = "csv"
 ) -> None:
     """
     Save a DataFrame to a file.
 
     Args:
         df: pandas DataFrame to save
-        file_path: Path where to save the file
+        file_path: Path where to save the file, or a binary file object
+            (e.g. io.BytesIO) to write to
         format: File format ('csv' or 'json')
 
     Raises:
         ValueError: If format is not supported
     """
-    path = Path(file_path)
+    target = Path(file_path) if isinstance(file_path, (str, Path)) else file_path
     format_lower = format.lower()
 
     if format_lower == "csv":
-        df.to_csv(path, index=False)
+        df.to_csv(target, index=False)
     elif format_lower == "json":
-        df.to_json(path, orient="records", indent=2)
+        # orjson encodes the records far faster than DataFrame.to_json;
+        # NaN is written as null as before
+        records = df.to_dict(orient="records")
+        try:
+            data = orjson.dumps(
+                records,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except orjson.JSONEncodeError:
+            # orjson cannot encode integers wider than 64 bits; the stdlib
+            # encoder would write NaN as a bare token, so map it to null first
+            records = [
+                {
+                    key: (
+                        None
+                        if isinstance(value, float) and math.isnan(value)
+                        else value
+                    )
+                    for key, value in row.items()
+                }
+                for row in records
+            ]
+            data = json.dumps(
+                records, default=_json_default, indent=2, allow_nan=False
+            ).encode()
+        if isinstance(target, Path):
+            target.write_bytes(data)
+        else:
+            target.write(data)
     else:
         raise ValueError(f"Unsupported format: {format}. Use 'csv' or 'json'")
 
@@ -11,8 +11,25 @@ These functions are designed to be:
 - Reusable across different interfaces (API, CLI, etc.)
 """
 
+import math
+import threading
+from functools import lru_cache
 from typing import List, Union
 
+import numpy as np
+
+# Miller-Rabin witnesses that make the test deterministic for every
+# n < 3,317,044,064,679,887,385,961,981 (this covers all 64-bit integers)
+_MILLER_RABIN_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Factorial and Fibonacci results grow with n, so they are only memoized for
+# inputs up to this bound to keep the caches' memory use small
+_CACHE_MAX_N = 1000
+
+# Lists at least this long are summarized with NumPy; below it NumPy's fixed
+# per-call overhead outweighs the faster vectorized loops
+_NUMPY_STATS_THRESHOLD = 256
+
 
 def square(number: Union[int, float]) -> Union[int, float]:
     """
@@ -30,7 +47,8 @@ def square(number: Union[int, float]) -> Union[int, float]:
     if not isinstance(number, (int, float)):
         raise TypeError("Input must be a number (int or float)")
 
-    return number**2
+    # A single multiplication skips the generic exponentiation machinery
+    return number * number
 
 
 def power(base: Union[int, float], exponent: Union[int, float]) -> Union[int, float]:
@@ -53,6 +71,10 @@ def power(base: Union[int, float], exponent: Union[int, float]) -> Union[int, fl
     return base**exponent
 
 
+# Memoized math.factorial, used for n <= _CACHE_MAX_N
+_factorial_cached = lru_cache(maxsize=4096)(math.factorial)
+
+
 def factorial(n: int) -> int:
     """
     Calculate the factorial of a non-negative integer.
@@ -73,14 +95,33 @@ def factorial(n: int) -> int:
     if n < 0:
         raise ValueError("Factorial is only defined for non-negative integers")
 
-    if n == 0 or n == 1:
-        return 1
+    if n <= _CACHE_MAX_N:
+        return _factorial_cached(n)
 
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
+    # math.factorial is implemented in C with a divide-and-conquer product,
+    # which is much faster than multiplying in a Python loop
+    return math.factorial(n)
 
-    return result
+
+def _fibonacci(n: int) -> List[int]:
+    """Generate the first n Fibonacci numbers (n must be positive)."""
+    # Preallocate the result and carry the last two values in locals, avoiding
+    # list growth from append() and re-reading previous elements by index
+    fib_sequence = [0] * n
+    a, b = 0, 1
+    for i in range(n):
+        fib_sequence[i] = a
+        a, b = b, a + b
+
+    return fib_sequence
+
+
+# Fibonacci numbers computed so far. Every sequence is a prefix of any longer
+# one, so calls only compute the terms past the longest earlier request. The
+# lock guards growth because API handlers run in a threadpool. The first 128
+# terms are computed at import so typical requests are a plain slice.
+_FIB_CACHE = _fibonacci(128)
+_FIB_CACHE_LOCK = threading.Lock()
 
 
 def fibonacci(n: int) -> List[int]:
@@ -103,22 +144,28 @@ def fibonacci(n: int) -> List[int]:
     if n <= 0:
         raise ValueError("Input must be a positive integer")
 
-    if n == 1:
-        return [0]
-    elif n == 2:
-        return [0, 1]
+    if n > _CACHE_MAX_N:
+        return _fibonacci(n)
 
-    fib_sequence = [0, 1]
-    for i in range(2, n):
-        fib_sequence.append(fib_sequence[i - 1] + fib_sequence[i - 2])
+    if len(_FIB_CACHE) < n:
+        with _FIB_CACHE_LOCK:
+            a, b = _FIB_CACHE[-2], _FIB_CACHE[-1]
+            while len(_FIB_CACHE) < n:
+                a, b = b, a + b
+                _FIB_CACHE.append(b)
 
-    return fib_sequence
+    # Slicing copies, so callers can't mutate the cached prefix
+    return _FIB_CACHE[:n]
 
 
 def is_prime(n: int) -> bool:
     """
     Check if a number is prime.
 
+    Uses the Miller-Rabin test with a fixed witness set, which is exact for
+    all n below 3.3e24. Larger inputs are strong probable primes to all
+    twelve witnesses, which makes a wrong answer vanishingly unlikely.
+
     Args:
         n: The number to check
 
@@ -135,15 +182,33 @@ def is_prime(n: int) -> bool:
     if n < 2:
         raise ValueError("Prime numbers are defined for integers >= 2")
 
-    if n == 2:
-        return True
-
-    if n % 2 == 0:
-        return False
-
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
+    return _is_prime(n)
+
+
+@lru_cache(maxsize=4096)
+def _is_prime(n: int) -> bool:
+    """Memoized Miller-Rabin primality test (n must be >= 2)."""
+    # Small primes double as a quick trial-division filter
+    for p in _MILLER_RABIN_WITNESSES:
+        if n % p == 0:
+            return n == p
+
+    # Miller-Rabin: write n - 1 as d * 2^s with d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in _MILLER_RABIN_WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
             return False
 
     return True
@@ -170,15 +235,38 @@ def calculate_stats(numbers: List[Union[int, float]]) -> dict:
         raise ValueError("List cannot be empty")
 
     # Validate all elements are numbers
-    for num in numbers:
-        if not isinstance(num, (int, float)):
-            raise TypeError("All elements must be numbers")
+    if not all(isinstance(num, (int, float)) for num in numbers):
+        raise TypeError("All elements must be numbers")
+
+    return _calculate_stats_trusted(numbers)
+
+
+def _calculate_stats_trusted(numbers: List[Union[int, float]]) -> dict:
+    """
+    Calculate statistics without validating the input.
+
+    For callers that already guarantee a non-empty list of numbers, such as
+    the API layer where Pydantic has validated the request body.
+
+    Args:
+        numbers: Non-empty list of numbers
+
+    Returns:
+        Dictionary containing mean, median, min, max, and count
+    """
+    if len(numbers) >= _NUMPY_STATS_THRESHOLD:
+        stats = _calculate_stats_numpy(numbers)
+        if stats is not None:
+            return stats
 
+    # One sort gives the median and both extremes; the sum is computed once
+    # and shared by the mean and the result
     sorted_numbers = sorted(numbers)
-    count = len(numbers)
+    count = len(sorted_numbers)
+    total = sum(numbers)
 
     # Calculate mean
-    mean = sum(numbers) / count
+    mean = total / count
 
     # Calculate median
     if count % 2 == 0:
@@ -190,7 +278,58 @@ def calculate_stats(numbers: List[Union[int, float]]) -> dict:
         "count": count,
         "mean": mean,
         "median": median,
-        "min": min(numbers),
-        "max": max(numbers),
-        "sum": sum(numbers),
+        "min": sorted_numbers[0],
+        "max": sorted_numbers[-1],
+        "sum": total,
+    }
+
+
+def _calculate_stats_numpy(numbers: List[Union[int, float]]) -> Union[dict, None]:
+    """
+    Calculate the same statistics as calculate_stats using NumPy reductions.
+
+    Min, max and odd-length medians are looked up in the original list so
+    they keep their Python type. The median uses np.partition, which is O(n)
+    instead of a full sort.
+
+    Args:
+        numbers: Non-empty list of numbers
+
+    Returns:
+        Statistics dictionary, or None if NumPy cannot compute the result
+        exactly (e.g. bools, huge integers or non-finite values)
+    """
+    array = np.asarray(numbers)
+    if array.dtype.kind not in "if":
+        return None
+
+    count = len(numbers)
+    minimum = numbers[int(array.argmin())]
+    maximum = numbers[int(array.argmax())]
+
+    # Leave inputs NumPy could get wrong to the Python path: int64 sums wrap
+    # around silently, and float64 is only exact for integers up to 2**53
+    # (this also routes NaN and infinity to Python)
+    limit = 2**63 // count if array.dtype.kind == "i" else 2**53
+    if not (abs(minimum) < limit and abs(maximum) < limit):
+        return None
+
+    total = array.sum().item()
+
+    middle = count // 2
+    if count % 2 == 0:
+        lower, upper = np.partition(array, [middle - 1, middle])[
+            middle - 1 : middle + 1
+        ]
+        median = (lower.item() + upper.item()) / 2
+    else:
+        median = numbers[int(np.argpartition(array, middle)[middle])]
+
+    return {
+        "count": count,
+        "mean": total / count,
+        "median": median,
+        "min": minimum,
+        "max": maximum,
+        "sum": total,
     }
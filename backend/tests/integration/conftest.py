@@ -0,0 +1,44 @@
+"""Shared pytest fixtures for the integration tests."""
+
+import contextlib
+import functools
+import io
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import cli
+from app import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """A test client shared by the whole session, with the app lifespan started."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _run_cli(*args):
+    """Run the CLI in-process and return its exit code and captured output."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        returncode = cli.main(list(args))
+    return SimpleNamespace(
+        returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue()
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _run_cli_cached(args):
+    """Memoized _run_cli; CLI output is a pure function of argv."""
+    return _run_cli(*args)
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Run CLI commands in this process: cli_runner("square", "5").
+
+    Results are cached by argv, so tests must not modify them.
+    """
+    return lambda *args: _run_cli_cached(args)
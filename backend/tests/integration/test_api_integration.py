@@ -12,348 +12,538 @@ verify that:
 This shows how to test the API layer separately from the business logic layer.
 """
 
-import unittest
+import asyncio
 
+import httpx
 from fastapi.testclient import TestClient
 
-from app import app
+from app import PureGetCacheMiddleware, app
 
-# Create test client
-client = TestClient(app)
+# Basic API information endpoints
 
 
-class TestAPIRootEndpoints(unittest.TestCase):
-    """Test basic API information endpoints."""
+def test_root_endpoint(client):
+    """Test the root API information endpoint."""
+    response = client.get("/")
+    assert response.status_code == 200
 
-    def test_root_endpoint(self):
-        """Test the root API information endpoint."""
-        response = client.get("/")
-        self.assertEqual(response.status_code, 200)
+    data = response.json()
+    assert data["message"] == "Mathematical Operations API"
+    assert data["version"] == "1.0.0"
+    assert data["docs_url"] == "/docs"
+    assert "endpoints" in data
+    assert isinstance(data["endpoints"], dict)
 
-        data = response.json()
-        self.assertEqual(data["message"], "Mathematical Operations API")
-        self.assertEqual(data["version"], "1.0.0")
-        self.assertEqual(data["docs_url"], "/docs")
-        self.assertIn("endpoints", data)
-        self.assertIsInstance(data["endpoints"], dict)
 
-    def test_health_endpoint(self):
-        """Test the health check endpoint."""
-        response = client.get("/health")
-        self.assertEqual(response.status_code, 200)
+def test_health_endpoint(client):
+    """Test the health check endpoint."""
+    response = client.get("/health")
+    assert response.status_code == 200
 
-        data = response.json()
-        self.assertEqual(data["status"], "healthy")
-        self.assertEqual(data["service"], "math-operations-api")
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["service"] == "math-operations-api"
 
 
-class TestGETEndpoints(unittest.TestCase):
-    """Test GET endpoints for mathematical operations."""
+# GET endpoints for mathematical operations
 
-    def test_square_positive_integer(self):
-        """Test square endpoint with positive integer."""
-        response = client.get("/square/5")
-        self.assertEqual(response.status_code, 200)
 
-        data = response.json()
-        self.assertEqual(data["operation"], "square")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input"], 5)
-        self.assertEqual(data["result"], 25)
+def test_square_positive_integer(client):
+    """Test square endpoint with positive integer."""
+    response = client.get("/square/5")
+    assert response.status_code == 200
 
-    def test_square_negative_integer(self):
-        """Test square endpoint with negative integer."""
-        response = client.get("/square/-4")
-        self.assertEqual(response.status_code, 200)
+    data = response.json()
+    assert data["operation"] == "square"
+    assert data["success"]
+    assert data["input"] == 5
+    assert data["result"] == 25
 
-        data = response.json()
-        self.assertEqual(data["operation"], "square")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input"], -4)
-        self.assertEqual(data["result"], 16)
 
-    def test_square_float(self):
-        """Test square endpoint with float."""
-        response = client.get("/square/2.5")
-        self.assertEqual(response.status_code, 200)
+def test_square_negative_integer(client):
+    """Test square endpoint with negative integer."""
+    response = client.get("/square/-4")
+    assert response.status_code == 200
 
-        data = response.json()
-        self.assertEqual(data["operation"], "square")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input"], 2.5)
-        self.assertEqual(data["result"], 6.25)
+    data = response.json()
+    assert data["operation"] == "square"
+    assert data["success"]
+    assert data["input"] == -4
+    assert data["result"] == 16
 
-    def test_factorial_valid_input(self):
-        """Test factorial endpoint with valid input."""
-        response = client.get("/factorial/5")
-        self.assertEqual(response.status_code, 200)
 
-        data = response.json()
-        self.assertEqual(data["operation"], "factorial")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input"], 5)
-        self.assertEqual(data["result"], 120)
+def test_square_float(client):
+    """Test square endpoint with float."""
+    response = client.get("/square/2.5")
+    assert response.status_code == 200
 
-    def test_factorial_zero(self):
-        """Test factorial endpoint with zero."""
-        response = client.get("/factorial/0")
-        self.assertEqual(response.status_code, 200)
+    data = response.json()
+    assert data["operation"] == "square"
+    assert data["success"]
+    assert data["input"] == 2.5
+    assert data["result"] == 6.25
 
-        data = response.json()
-        self.assertEqual(data["operation"], "factorial")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input"], 0)
-        self.assertEqual(data["result"], 1)
 
-    def test_factorial_invalid_negative(self):
-        """Test factorial endpoint with negative number (should fail)."""
-        response = client.get("/factorial/-5")
-        self.assertEqual(response.status_code, 400)
+def test_square_beyond_64_bits(client):
+    """Test square endpoint with an input wider than 64 bits."""
+    response = client.get("/square/99999999999999999999")
+    assert response.status_code == 200
 
-        data = response.json()
-        self.assertIn("Invalid input", data["detail"])
+    data = response.json()
+    assert data["input"] == 99999999999999999999
+    assert data["result"] == 9999999999999999999800000000000000000001
 
-    def test_fibonacci_sequence(self):
-        """Test fibonacci endpoint."""
-        response = client.get("/fibonacci/8")
-        self.assertEqual(response.status_code, 200)
 
-        data = response.json()
-        self.assertEqual(data["operation"], "fibonacci")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["count"], 8)
-        self.assertEqual(data["sequence"], [0, 1, 1, 2, 3, 5, 8, 13])
+def test_square_non_finite_result(client):
+    """Test square endpoint rejects results JSON cannot represent."""
+    for path in ("/square/1e200", "/square/inf"):
+        response = client.get(path)
+        assert response.status_code == 400
+        assert "not a finite number" in response.json()["detail"]
+        assert "cache-control" not in response.headers
 
-    def test_fibonacci_invalid_zero(self):
-        """Test fibonacci endpoint with zero (should fail)."""
-        response = client.get("/fibonacci/0")
-        self.assertEqual(response.status_code, 400)
 
-        data = response.json()
-        self.assertIn("Invalid input", data["detail"])
+def test_factorial_valid_input(client):
+    """Test factorial endpoint with valid input."""
+    response = client.get("/factorial/5")
+    assert response.status_code == 200
 
-    def test_prime_check_prime_number(self):
-        """Test prime endpoint with a prime number."""
-        response = client.get("/prime/17")
-        self.assertEqual(response.status_code, 200)
+    data = response.json()
+    assert data["operation"] == "factorial"
+    assert data["success"]
+    assert data["input"] == 5
+    assert data["result"] == 120
 
-        data = response.json()
-        self.assertEqual(data["operation"], "is_prime")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input"], 17)
-        self.assertTrue(data["is_prime"])
 
-    def test_prime_check_composite_number(self):
-        """Test prime endpoint with a composite number."""
-        response = client.get("/prime/15")
-        self.assertEqual(response.status_code, 200)
+def test_factorial_zero(client):
+    """Test factorial endpoint with zero."""
+    response = client.get("/factorial/0")
+    assert response.status_code == 200
 
-        data = response.json()
-        self.assertEqual(data["operation"], "is_prime")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input"], 15)
-        self.assertFalse(data["is_prime"])
+    data = response.json()
+    assert data["operation"] == "factorial"
+    assert data["success"]
+    assert data["input"] == 0
+    assert data["result"] == 1
 
-    def test_prime_check_invalid_input(self):
-        """Test prime endpoint with invalid input (< 2)."""
-        response = client.get("/prime/1")
-        self.assertEqual(response.status_code, 400)
 
-        data = response.json()
-        self.assertIn("Invalid input", data["detail"])
+def test_factorial_beyond_64_bits(client):
+    """Test factorial endpoint with a result wider than 64 bits."""
+    response = client.get("/factorial/25")
+    assert response.status_code == 200
 
+    data = response.json()
+    assert data["input"] == 25
+    assert data["result"] == 15511210043330985984000000
 
-class TestPOSTEndpoints(unittest.TestCase):
-    """Test POST endpoints with JSON payloads."""
 
-    def test_power_valid_input(self):
-        """Test power endpoint with valid input."""
-        payload = {"base": 2, "exponent": 8}
-        response = client.post("/power", json=payload)
-        self.assertEqual(response.status_code, 200)
+def test_factorial_invalid_negative(client):
+    """Test factorial endpoint with negative number (should fail)."""
+    response = client.get("/factorial/-5")
+    assert response.status_code == 400
 
-        data = response.json()
-        self.assertEqual(data["operation"], "power")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["base"], 2)
-        self.assertEqual(data["exponent"], 8)
-        self.assertEqual(data["result"], 256)
-
-    def test_power_float_inputs(self):
-        """Test power endpoint with float inputs."""
-        payload = {"base": 4.0, "exponent": 0.5}
-        response = client.post("/power", json=payload)
-        self.assertEqual(response.status_code, 200)
+    data = response.json()
+    assert "Invalid input" in data["detail"]
 
-        data = response.json()
-        self.assertEqual(data["operation"], "power")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["base"], 4.0)
-        self.assertEqual(data["exponent"], 0.5)
-        self.assertEqual(data["result"], 2.0)
-
-    def test_power_missing_field(self):
-        """Test power endpoint with missing required field."""
-        payload = {"base": 2}  # Missing exponent
-        response = client.post("/power", json=payload)
-        self.assertEqual(response.status_code, 422)  # Validation error
 
-        data = response.json()
-        self.assertIn("detail", data)
-        # FastAPI returns validation errors in specific format
-        self.assertTrue(any("exponent" in str(error) for error in data["detail"]))
-
-    def test_power_invalid_types(self):
-        """Test power endpoint with invalid data types."""
-        payload = {"base": "invalid", "exponent": 2}
-        response = client.post("/power", json=payload)
-        self.assertEqual(response.status_code, 422)  # Validation error
-
-    def test_stats_valid_input(self):
-        """Test stats endpoint with valid input."""
-        payload = {"numbers": [1, 2, 3, 4, 5]}
-        response = client.post("/stats", json=payload)
-        self.assertEqual(response.status_code, 200)
+def test_fibonacci_sequence(client):
+    """Test fibonacci endpoint."""
+    response = client.get("/fibonacci/8")
+    assert response.status_code == 200
 
-        data = response.json()
-        self.assertEqual(data["operation"], "calculate_stats")
-        self.assertTrue(data["success"])
-        self.assertEqual(data["input_numbers"], [1, 2, 3, 4, 5])
-
-        stats = data["statistics"]
-        self.assertEqual(stats["count"], 5)
-        self.assertEqual(stats["mean"], 3.0)
-        self.assertEqual(stats["median"], 3)
-        self.assertEqual(stats["min"], 1)
-        self.assertEqual(stats["max"], 5)
-        self.assertEqual(stats["sum"], 15)
-
-    def test_stats_float_numbers(self):
-        """Test stats endpoint with float numbers."""
-        payload = {"numbers": [1.5, 2.5, 3.5]}
-        response = client.post("/stats", json=payload)
-        self.assertEqual(response.status_code, 200)
+    data = response.json()
+    assert data["operation"] == "fibonacci"
+    assert data["success"]
+    assert data["count"] == 8
+    assert data["sequence"] == [0, 1, 1, 2, 3, 5, 8, 13]
 
-        data = response.json()
-        stats = data["statistics"]
-        self.assertEqual(stats["count"], 3)
-        self.assertEqual(stats["mean"], 2.5)
-        self.assertEqual(stats["median"], 2.5)
 
-    def test_stats_empty_list(self):
-        """Test stats endpoint with empty list (should fail validation)."""
-        payload = {"numbers": []}
-        response = client.post("/stats", json=payload)
-        self.assertEqual(response.status_code, 422)  # Validation error
+def test_fibonacci_beyond_64_bits(client):
+    """Test fibonacci endpoint with terms wider than 64 bits."""
+    response = client.get("/fibonacci/100")
+    assert response.status_code == 200
 
-        data = response.json()
-        self.assertIn("detail", data)
+    data = response.json()
+    assert data["count"] == 100
+    assert len(data["sequence"]) == 100
+    assert data["sequence"][-1] == 218922995834555169026
 
-    def test_stats_missing_numbers_field(self):
-        """Test stats endpoint with missing numbers field."""
-        payload = {}
-        response = client.post("/stats", json=payload)
-        self.assertEqual(response.status_code, 422)  # Validation error
 
-    def test_stats_invalid_content_type(self):
-        """Test POST endpoint without proper JSON content type."""
-        response = client.post("/stats", data="invalid")
-        self.assertEqual(response.status_code, 422)  # Should fail validation
+def test_fibonacci_invalid_zero(client):
+    """Test fibonacci endpoint with zero (should fail)."""
+    response = client.get("/fibonacci/0")
+    assert response.status_code == 400
 
+    data = response.json()
+    assert "Invalid input" in data["detail"]
 
-class TestErrorHandling(unittest.TestCase):
-    """Test error handling and edge cases."""
 
-    def test_nonexistent_endpoint(self):
-        """Test calling a non-existent endpoint."""
-        response = client.get("/nonexistent")
-        self.assertEqual(response.status_code, 404)
+def test_prime_check_prime_number(client):
+    """Test prime endpoint with a prime number."""
+    response = client.get("/prime/17")
+    assert response.status_code == 200
 
-    def test_invalid_http_method(self):
-        """Test using wrong HTTP method."""
-        response = client.post("/square/5")  # Should be GET
-        self.assertEqual(response.status_code, 405)  # Method not allowed
+    data = response.json()
+    assert data["operation"] == "is_prime"
+    assert data["success"]
+    assert data["input"] == 17
+    assert data["is_prime"]
 
-    def test_invalid_path_parameter_type(self):
-        """Test with invalid path parameter types where FastAPI expects int."""
-        response = client.get("/factorial/invalid")
-        self.assertEqual(response.status_code, 422)  # Validation error
 
+def test_prime_check_composite_number(client):
+    """Test prime endpoint with a composite number."""
+    response = client.get("/prime/15")
+    assert response.status_code == 200
 
-class TestResponseModels(unittest.TestCase):
-    """Test that response models are properly validated."""
+    data = response.json()
+    assert data["operation"] == "is_prime"
+    assert data["success"]
+    assert data["input"] == 15
+    assert not data["is_prime"]
 
-    def test_square_response_structure(self):
-        """Verify square response has all expected fields."""
-        response = client.get("/square/3")
-        self.assertEqual(response.status_code, 200)
 
-        data = response.json()
-        required_fields = {"operation", "success", "input", "result"}
-        assert required_fields.issubset(data.keys())
+def test_prime_check_invalid_input(client):
+    """Test prime endpoint with invalid input (< 2)."""
+    response = client.get("/prime/1")
+    assert response.status_code == 400
 
-    def test_fibonacci_response_structure(self):
-        """Verify fibonacci response has all expected fields."""
-        response = client.get("/fibonacci/5")
-        self.assertEqual(response.status_code, 200)
+    data = response.json()
+    assert "Invalid input" in data["detail"]
 
-        data = response.json()
-        required_fields = {"operation", "success", "count", "sequence"}
-        assert required_fields.issubset(data.keys())
-        assert isinstance(data["sequence"], list)
 
-    def test_stats_response_nested_structure(self):
-        """Verify stats response has proper nested structure."""
-        payload = {"numbers": [1, 2, 3]}
-        response = client.post("/stats", json=payload)
-        self.assertEqual(response.status_code, 200)
+# POST endpoints with JSON payloads
+
+
+def test_power_valid_input(client):
+    """Test power endpoint with valid input."""
+    payload = {"base": 2, "exponent": 8}
+    response = client.post("/power", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["operation"] == "power"
+    assert data["success"]
+    assert data["base"] == 2
+    assert data["exponent"] == 8
+    assert data["result"] == 256
+
+
+def test_power_float_inputs(client):
+    """Test power endpoint with float inputs."""
+    payload = {"base": 4.0, "exponent": 0.5}
+    response = client.post("/power", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["operation"] == "power"
+    assert data["success"]
+    assert data["base"] == 4.0
+    assert data["exponent"] == 0.5
+    assert data["result"] == 2.0
+
+
+def test_power_beyond_64_bits(client):
+    """Test power endpoint with a result wider than 64 bits."""
+    payload = {"base": 10, "exponent": 30}
+    response = client.post("/power", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["result"] == 10**30
+
+
+def test_power_complex_result(client):
+    """Test power endpoint rejects results that are not real numbers."""
+    payload = {"base": -8, "exponent": 0.5}
+    response = client.post("/power", json=payload)
+    assert response.status_code == 400
+    assert "not a real number" in response.json()["detail"]
+
+
+def test_power_missing_field(client):
+    """Test power endpoint with missing required field."""
+    payload = {"base": 2}  # Missing exponent
+    response = client.post("/power", json=payload)
+    assert response.status_code == 422  # Validation error
+
+    data = response.json()
+    assert "detail" in data
+    # FastAPI returns validation errors in specific format
+    assert any("exponent" in str(error) for error in data["detail"])
+
+
+def test_power_invalid_types(client):
+    """Test power endpoint with invalid data types."""
+    payload = {"base": "invalid", "exponent": 2}
+    response = client.post("/power", json=payload)
+    assert response.status_code == 422  # Validation error
+
+
+def test_stats_valid_input(client):
+    """Test stats endpoint with valid input."""
+    payload = {"numbers": [1, 2, 3, 4, 5]}
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["operation"] == "calculate_stats"
+    assert data["success"]
+    assert data["input_numbers"] == [1, 2, 3, 4, 5]
+
+    stats = data["statistics"]
+    assert stats["count"] == 5
+    assert stats["mean"] == 3.0
+    assert stats["median"] == 3
+    assert stats["min"] == 1
+    assert stats["max"] == 5
+    assert stats["sum"] == 15
+
+
+def test_stats_float_numbers(client):
+    """Test stats endpoint with float numbers."""
+    payload = {"numbers": [1.5, 2.5, 3.5]}
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    stats = data["statistics"]
+    assert stats["count"] == 3
+    assert stats["mean"] == 2.5
+    assert stats["median"] == 2.5
+
+
+def test_stats_beyond_64_bits(client):
+    """Test stats endpoint with an input wider than 64 bits."""
+    payload = {"numbers": [10**20, 1]}
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["input_numbers"] == [10**20, 1]
+    assert data["statistics"]["max"] == 10**20
+    assert data["statistics"]["sum"] == 10**20 + 1
+
+
+def test_stats_non_finite_result(client):
+    """Test stats endpoint rejects a sum that overflows to inf."""
+    payload = {"numbers": [1e308, 1e308]}
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 400
+    assert "not a finite number" in response.json()["detail"]
+
+
+def test_stats_empty_list(client):
+    """Test stats endpoint with empty list (should fail validation)."""
+    payload = {"numbers": []}
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 422  # Validation error
+
+    data = response.json()
+    assert "detail" in data
 
-        data = response.json()
-        self.assertIn("statistics", data)
 
-        stats = data["statistics"]
-        required_stats = {"count", "mean", "median", "min", "max", "sum"}
-        assert required_stats.issubset(stats.keys())
+def test_stats_missing_numbers_field(client):
+    """Test stats endpoint with missing numbers field."""
+    payload = {}
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 422  # Validation error
+
+
+def test_stats_invalid_content_type(client):
+    """Test POST endpoint without proper JSON content type."""
+    response = client.post("/stats", data="invalid")
+    assert response.status_code == 422  # Should fail validation
+
+
+def test_stats_empty_body(client):
+    """Test POST endpoint with an empty body reports a missing body."""
+    response = client.post(
+        "/stats", content=b"", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
+
+    error = response.json()["detail"][0]
+    assert error["type"] == "missing"
+    assert error["loc"] == ["body"]
+
+
+def test_stats_malformed_json(client):
+    """Test POST endpoint with malformed JSON reports the decode offset."""
+    response = client.post(
+        "/stats",
+        content=b'{"numbers": [1,2,',
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+
+    error = response.json()["detail"][0]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body", 17]
+
+
+# Error handling and edge cases
+
+
+def test_nonexistent_endpoint(client):
+    """Test calling a non-existent endpoint."""
+    response = client.get("/nonexistent")
+    assert response.status_code == 404
+
+
+def test_invalid_http_method(client):
+    """Test using wrong HTTP method."""
+    response = client.post("/square/5")  # Should be GET
+    assert response.status_code == 405  # Method not allowed
+
+
+def test_invalid_path_parameter_type(client):
+    """Test with invalid path parameter types where FastAPI expects int."""
+    response = client.get("/factorial/invalid")
+    assert response.status_code == 422  # Validation error
+
+
+# Response caching for deterministic GET endpoints
+
+
+def test_pure_get_response_is_cached(client):
+    """Repeated GETs return the same body with a Cache-Control header."""
+    first = client.get("/factorial/12")
+    second = client.get("/factorial/12")
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["cache-control"] == "public, max-age=86400"
+
+
+def test_cached_response_keeps_cors_headers(client):
+    """Cached responses still get CORS headers for the requesting origin."""
+    client.get("/prime/97")
+    response = client.get("/prime/97", headers={"Origin": "http://localhost:3000"})
+
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+def test_cached_response_does_not_replay_cors_headers(client):
+    """CORS headers of the first caller are not served to later callers."""
+    client.get("/square/77", headers={"Origin": "http://localhost:3000"})
+
+    for headers in ({"Origin": "http://evil.example"}, {}):
+        response = client.get("/square/77", headers=headers)
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+        assert "origin" not in response.headers.get("vary", "").lower()
+
+
+def test_error_response_is_not_cached(client):
+    """Error responses are not marked cacheable."""
+    response = client.get("/fibonacci/0")
+
+    assert response.status_code == 400
+    assert "cache-control" not in response.headers
+
+
+def test_large_response_is_not_cached():
+    """Bodies over max_body_bytes are served but not kept in the cache."""
+    calls = []
+
+    async def endpoint(scope, receive, send):
+        calls.append(scope["path"])
+        body = b"x" * len(scope["path"]) * 100
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+    middleware = PureGetCacheMiddleware(endpoint, prefixes=("/",), max_body_bytes=500)
+    test_client = TestClient(middleware)
+    for _ in range(2):
+        assert len(test_client.get("/big/path").content) == 900
+        assert len(test_client.get("/ok").content) == 300
+
+    assert calls == ["/big/path", "/ok", "/big/path"]
+    assert list(middleware.cache) == ["/ok"]
+
+
+# Response model structure
+
+
+def test_square_response_structure(client):
+    """Verify square response has all expected fields."""
+    response = client.get("/square/3")
+    assert response.status_code == 200
+
+    data = response.json()
+    required_fields = {"operation", "success", "input", "result"}
+    assert required_fields.issubset(data.keys())
+
+
+def test_fibonacci_response_structure(client):
+    """Verify fibonacci response has all expected fields."""
+    response = client.get("/fibonacci/5")
+    assert response.status_code == 200
+
+    data = response.json()
+    required_fields = {"operation", "success", "count", "sequence"}
+    assert required_fields.issubset(data.keys())
+    assert isinstance(data["sequence"], list)
+
+
+def test_stats_response_nested_structure(client):
+    """Verify stats response has proper nested structure."""
+    payload = {"numbers": [1, 2, 3]}
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert "statistics" in data
+
+    stats = data["statistics"]
+    required_stats = {"count", "mean", "median", "min", "max", "sum"}
+    assert required_stats.issubset(stats.keys())
 
 
 # Performance and load testing (basic examples)
-class TestPerformance(unittest.TestCase):
-    """Basic performance testing examples."""
-
-    def test_multiple_requests_performance(self):
-        """Test making multiple requests to ensure stability."""
-        # Make 20 requests to square endpoint
-        for i in range(1, 21):
-            response = client.get(f"/square/{i}")
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            self.assertEqual(data["result"], i * i)
-
-    def test_large_fibonacci_sequence(self):
-        """Test with larger Fibonacci sequence."""
-        response = client.get("/fibonacci/20")
-        self.assertEqual(response.status_code, 200)
 
-        data = response.json()
-        self.assertEqual(len(data["sequence"]), 20)
-        self.assertEqual(data["sequence"][-1], 4181)  # 20th Fibonacci number
 
-    def test_large_statistics_dataset(self):
-        """Test statistics with larger dataset."""
-        large_dataset = list(range(1, 101))  # 1 to 100
-        payload = {"numbers": large_dataset}
+def test_multiple_requests_performance():
+    """Test making multiple concurrent requests to ensure stability."""
 
-        response = client.post("/stats", json=payload)
-        self.assertEqual(response.status_code, 200)
+    async def fetch_squares():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as async_client:
+            # Make 20 concurrent requests to square endpoint
+            return await asyncio.gather(
+                *(async_client.get(f"/square/{i}") for i in range(1, 21))
+            )
 
+    responses = asyncio.run(fetch_squares())
+    for i, response in enumerate(responses, start=1):
+        assert response.status_code == 200
         data = response.json()
-        stats = data["statistics"]
-        self.assertEqual(stats["count"], 100)
-        self.assertEqual(stats["mean"], 50.5)
-        self.assertEqual(stats["min"], 1)
-        self.assertEqual(stats["max"], 100)
+        assert data["result"] == i * i
+
+
+def test_large_fibonacci_sequence(client):
+    """Test with larger Fibonacci sequence."""
+    response = client.get("/fibonacci/20")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert len(data["sequence"]) == 20
+    assert data["sequence"][-1] == 4181  # 20th Fibonacci number
+
+
+def test_large_statistics_dataset(client):
+    """Test statistics with larger dataset."""
+    large_dataset = list(range(1, 101))  # 1 to 100
+    payload = {"numbers": large_dataset}
 
+    response = client.post("/stats", json=payload)
+    assert response.status_code == 200
 
-if __name__ == "__main__":
-    # Run integration tests when script is executed directly
-    unittest.main()
+    data = response.json()
+    stats = data["statistics"]
+    assert stats["count"] == 100
+    assert stats["mean"] == 50.5
+    assert stats["min"] == 1
+    assert stats["max"] == 100
@@ -12,13 +12,18 @@ Tests cover:
 - Input validation
 """
 
+import io
 import json
+import math
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import pandas as pd
 
+from src import data_parsing
 from src.data_parsing import (
     aggregate_dataframe,
     dataframe_summary,
@@ -28,6 +33,7 @@ from src.data_parsing import (
     load_json,
     merge_dataframes,
     save_dataframe,
+    stream_json_records,
 )
 
 # Calculate path to backend/data directory
@@ -39,6 +45,21 @@ BACKEND_DIR = TESTS_DIR.parent  # backend/
 DATA_DIR = BACKEND_DIR / "data"  # backend/data/
 
 
+class SharedFramesTestCase(unittest.TestCase):
+    """Base class for tests that read the sample CSV frames."""
+
+    sample_df: pd.DataFrame
+    employees_df: pd.DataFrame
+    departments_df: pd.DataFrame
+
+
+def setUpModule():
+    # Parse the sample CSVs once for the whole module; tests don't mutate them
+    SharedFramesTestCase.sample_df = load_csv(DATA_DIR / "sample_data.csv")
+    SharedFramesTestCase.employees_df = load_csv(DATA_DIR / "employees.csv")
+    SharedFramesTestCase.departments_df = load_csv(DATA_DIR / "departments.csv")
+
+
 class TestLoadCSV(unittest.TestCase):
     """Tests for the load_csv function."""
 
@@ -60,6 +81,50 @@ class TestLoadCSV(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             load_csv(csv_path)
 
+    def test_load_csv_short_rows(self):
+        """Test that rows with missing trailing fields still load."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".csv", delete=False
+        ) as temp_file:
+            temp_file.write("a,b,c\n1,2,3\n4,5\n")
+            temp_path = Path(temp_file.name)
+
+        try:
+            df = load_csv(temp_path)
+            self.assertEqual(len(df), 2)
+            self.assertTrue(pd.isna(df.loc[1, "c"]))
+        finally:
+            temp_path.unlink()
+
+    def test_load_csv_parquet_cache(self):
+        """Test that the opt-in Parquet cache is used and refreshed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "data.csv"
+            cache_path = Path(temp_dir) / "data.cache.parquet"
+            csv_path.write_text("a,b\n1,x\n2,y\n")
+
+            with mock.patch.object(data_parsing, "_CSV_CACHE_ENABLED", True):
+                first = load_csv(csv_path)
+                self.assertTrue(cache_path.exists())
+                pd.testing.assert_frame_equal(load_csv(csv_path), first)
+
+                # A CSV newer than its cache is parsed again
+                csv_path.write_text("a,b\n3,z\n")
+                stat = cache_path.stat()
+                os.utime(csv_path, (stat.st_atime, stat.st_mtime + 1))
+                self.assertEqual(list(load_csv(csv_path)["a"]), [3])
+
+    def test_load_csv_cache_disabled(self):
+        """Test that no cache file is written unless enabled."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "data.csv"
+            csv_path.write_text("a,b\n1,x\n")
+
+            with mock.patch.object(data_parsing, "_CSV_CACHE_ENABLED", False):
+                load_csv(csv_path)
+
+            self.assertEqual(os.listdir(temp_dir), ["data.csv"])
+
     def test_load_csv_invalid_file(self):
         """Test loading invalid CSV file that causes pandas error."""
         # Create a directory path instead of a file - this will cause pandas to fail
@@ -104,6 +169,61 @@ class TestLoadJSON(unittest.TestCase):
         finally:
             temp_path.unlink()
 
+    def test_load_json_keeps_wide_integers(self):
+        """Test integers wider than 64 bits load exactly."""
+        data = self._load_json_text('[{"id": 12345678901234567890123}]')
+        self.assertEqual(data, [{"id": 12345678901234567890123}])
+
+    def test_load_json_non_finite_literals(self):
+        """Test NaN and Infinity literals load as json.load reads them."""
+        data = self._load_json_text('[{"score": NaN, "max": Infinity}]')
+        self.assertTrue(math.isnan(data[0]["score"]))
+        self.assertEqual(data[0]["max"], math.inf)
+
+    def _load_json_text(self, text):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(text)
+            temp_path = Path(f.name)
+
+        try:
+            return load_json(temp_path)
+        finally:
+            temp_path.unlink()
+
+
+class TestStreamJSONRecords(unittest.TestCase):
+    """Tests for the stream_json_records function."""
+
+    def test_stream_matches_load_json(self):
+        """Test streamed records match the fully loaded file."""
+        json_path = DATA_DIR / "sample_data.json"
+        self.assertEqual(list(stream_json_records(json_path)), load_json(json_path))
+
+    def test_stream_builds_dataframe(self):
+        """Test building a DataFrame from streamed records."""
+        json_path = DATA_DIR / "sample_data.json"
+        df = pd.DataFrame.from_records(stream_json_records(json_path))
+
+        self.assertIn("price", df.columns)
+        self.assertEqual(df["price"].dtype, "float64")
+
+    def test_stream_file_not_found(self):
+        """Test streaming a non-existent file fails immediately."""
+        with self.assertRaises(FileNotFoundError):
+            stream_json_records(DATA_DIR / "nonexistent.json")
+
+    def test_stream_invalid_file(self):
+        """Test streaming an invalid JSON file."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write("[{ invalid json }]")
+            temp_path = Path(f.name)
+
+        try:
+            with self.assertRaises(ValueError):
+                list(stream_json_records(temp_path))
+        finally:
+            temp_path.unlink()
+
 
 class TestJSONToDataFrame(unittest.TestCase):
     """Tests for the json_to_dataframe function."""
@@ -136,13 +256,12 @@ class TestJSONToDataFrame(unittest.TestCase):
             json_to_dataframe("not a dict or list")
 
 
-class TestDataFrameSummary(unittest.TestCase):
+class TestDataFrameSummary(SharedFramesTestCase):
     """Tests for the dataframe_summary function."""
 
     def test_dataframe_summary_basic(self):
         """Test generating summary for sample data."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
         summary = dataframe_summary(df)
 
         self.assertIn("row_count", summary)
@@ -154,8 +273,7 @@ class TestDataFrameSummary(unittest.TestCase):
 
     def test_dataframe_summary_numeric_stats(self):
         """Test summary includes numeric statistics."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
         summary = dataframe_summary(df)
 
         # Should have numeric_stats since we have numeric columns
@@ -163,6 +281,19 @@ class TestDataFrameSummary(unittest.TestCase):
         self.assertIn("salary", summary["numeric_stats"])
         self.assertIn("age", summary["numeric_stats"])
 
+    def test_dataframe_summary_stat_values_and_nulls(self):
+        """Test reported statistics and null counts."""
+        df = pd.DataFrame({"x": [1.0, 2.0, None, 5.0], "label": ["a", None, "c", "d"]})
+        summary = dataframe_summary(df)
+
+        self.assertEqual(
+            set(summary["numeric_stats"]["x"]), {"count", "mean", "std", "min", "max"}
+        )
+        self.assertEqual(summary["numeric_stats"]["x"]["count"], 3)
+        self.assertEqual(summary["numeric_stats"]["x"]["mean"], 8.0 / 3)
+        self.assertEqual(summary["numeric_stats"]["x"]["max"], 5.0)
+        self.assertEqual(summary["null_counts"], {"x": 1, "label": 1})
+
     def test_dataframe_summary_empty(self):
         """Test summary for empty DataFrame."""
         df = pd.DataFrame()
@@ -173,13 +304,12 @@ class TestDataFrameSummary(unittest.TestCase):
         self.assertEqual(summary["columns"], [])
 
 
-class TestFilterDataFrame(unittest.TestCase):
+class TestFilterDataFrame(SharedFramesTestCase):
     """Tests for the filter_dataframe function."""
 
     def test_filter_equals(self):
         """Test filtering with equals condition."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         filtered = filter_dataframe(df, "department", "==", "Engineering")
 
@@ -189,8 +319,7 @@ class TestFilterDataFrame(unittest.TestCase):
 
     def test_filter_greater_than(self):
         """Test filtering with greater than condition."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         filtered = filter_dataframe(df, "age", ">", 30)
 
@@ -199,40 +328,83 @@ class TestFilterDataFrame(unittest.TestCase):
 
     def test_filter_less_than(self):
         """Test filtering with less than condition."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         filtered = filter_dataframe(df, "salary", "<", 70000)
 
         self.assertIsInstance(filtered, pd.DataFrame)
         self.assertTrue(all(filtered["salary"] < 70000))
 
+    def test_filter_in(self):
+        """Test filtering with membership condition."""
+        df = self.sample_df
+
+        filtered = filter_dataframe(df, "name", "in", ["Bob", "Eve"])
+
+        self.assertEqual(list(filtered["name"]), ["Bob", "Eve"])
+
+    def test_filter_column_name_with_space(self):
+        """Test filtering on column names that are not identifiers."""
+        df = pd.DataFrame({"first name": ["a", "b", "c"], "score": [1, 2, 3]})
+
+        filtered = filter_dataframe(df, "first name", "!=", "b")
+
+        self.assertEqual(list(filtered["first name"]), ["a", "c"])
+
+    def test_filter_contains(self):
+        """Test filtering with substring contains condition."""
+        df = self.sample_df
+
+        filtered = filter_dataframe(df, "department", "contains", "ing")
+
+        self.assertEqual(set(filtered["department"]), {"Engineering", "Marketing"})
+        self.assertEqual(list(filtered.columns), list(df.columns))
+
+    def test_filter_contains_is_literal(self):
+        """Test that contains matches regex metacharacters literally."""
+        df = pd.DataFrame({"code": ["a.b", "axb", None]})
+
+        filtered = filter_dataframe(df, "code", "contains", ".")
+
+        self.assertEqual(list(filtered["code"]), ["a.b"])
+
+    def test_filter_contains_mixed_column(self):
+        """Test that contains only matches string values in mixed columns."""
+        df = pd.DataFrame({"value": ["abc", 123, None, 1.5, True, "x1"]})
+
+        filtered = filter_dataframe(df, "value", "contains", "1")
+
+        self.assertEqual(list(filtered["value"]), ["x1"])
+
+    def test_filter_contains_non_string_column(self):
+        """Test that contains is rejected on numeric columns."""
+        df = self.sample_df
+
+        with self.assertRaises(ValueError):
+            filter_dataframe(df, "age", "contains", "3")
+
     def test_filter_invalid_column(self):
         """Test filtering with non-existent column."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         with self.assertRaises(ValueError):
             filter_dataframe(df, "nonexistent_column", "==", "value")
 
     def test_filter_invalid_condition(self):
         """Test filtering with invalid condition."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         with self.assertRaises(ValueError):
             filter_dataframe(df, "department", "invalid", "Engineering")
 
 
-class TestMergeDataFrames(unittest.TestCase):
+class TestMergeDataFrames(SharedFramesTestCase):
     """Tests for the merge_dataframes function."""
 
     def test_merge_dataframes_left_join(self):
         """Test merging DataFrames with left join."""
-        employees_path = DATA_DIR / "employees.csv"
-        departments_path = DATA_DIR / "departments.csv"
-        employees_df = load_csv(employees_path)
-        departments_df = load_csv(departments_path)
+        employees_df = self.employees_df
+        departments_df = self.departments_df
 
         merged = merge_dataframes(
             employees_df, departments_df, on="department_id", how="left"
@@ -246,10 +418,8 @@ class TestMergeDataFrames(unittest.TestCase):
 
     def test_merge_dataframes_inner_join(self):
         """Test merging DataFrames with inner join."""
-        employees_path = DATA_DIR / "employees.csv"
-        departments_path = DATA_DIR / "departments.csv"
-        employees_df = load_csv(employees_path)
-        departments_df = load_csv(departments_path)
+        employees_df = self.employees_df
+        departments_df = self.departments_df
 
         merged = merge_dataframes(
             employees_df, departments_df, on="department_id", how="inner"
@@ -260,20 +430,16 @@ class TestMergeDataFrames(unittest.TestCase):
 
     def test_merge_dataframes_invalid_column(self):
         """Test merging with non-existent column."""
-        employees_path = DATA_DIR / "employees.csv"
-        departments_path = DATA_DIR / "departments.csv"
-        employees_df = load_csv(employees_path)
-        departments_df = load_csv(departments_path)
+        employees_df = self.employees_df
+        departments_df = self.departments_df
 
         with self.assertRaises(ValueError):
             merge_dataframes(employees_df, departments_df, on="nonexistent", how="left")
 
     def test_merge_dataframes_invalid_how(self):
         """Test merging with invalid join type."""
-        employees_path = DATA_DIR / "employees.csv"
-        departments_path = DATA_DIR / "departments.csv"
-        employees_df = load_csv(employees_path)
-        departments_df = load_csv(departments_path)
+        employees_df = self.employees_df
+        departments_df = self.departments_df
 
         with self.assertRaises(ValueError):
             merge_dataframes(
@@ -281,13 +447,12 @@ class TestMergeDataFrames(unittest.TestCase):
             )
 
 
-class TestAggregateDataFrame(unittest.TestCase):
+class TestAggregateDataFrame(SharedFramesTestCase):
     """Tests for the aggregate_dataframe function."""
 
     def test_aggregate_dataframe_by_department(self):
         """Test aggregating data by department."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         stats = aggregate_dataframe(
             df,
@@ -301,8 +466,7 @@ class TestAggregateDataFrame(unittest.TestCase):
 
     def test_aggregate_dataframe_invalid_group_column(self):
         """Test aggregating with non-existent group column."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         with self.assertRaises(ValueError):
             aggregate_dataframe(
@@ -311,8 +475,7 @@ class TestAggregateDataFrame(unittest.TestCase):
 
     def test_aggregate_dataframe_invalid_agg_column(self):
         """Test aggregating with non-existent aggregation column."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
 
         with self.assertRaises(ValueError):
             aggregate_dataframe(
@@ -342,51 +505,96 @@ class TestSaveDataFrame(unittest.TestCase):
             if temp_path.exists():
                 temp_path.unlink()
 
+    def test_save_dataframe_to_csv_buffer(self):
+        """Test saving DataFrame as CSV to an in-memory buffer."""
+        df = load_csv(DATA_DIR / "sample_data.csv")
+        buffer = io.BytesIO()
+
+        save_dataframe(df, buffer, format="csv")
+
+        self.assertGreater(buffer.tell(), 0)
+        buffer.seek(0)
+        self.assertEqual(len(pd.read_csv(buffer)), len(df))
+
     def test_save_dataframe_to_json(self):
         """Test saving DataFrame to JSON."""
         json_path = DATA_DIR / "sample_data.json"
         json_data = load_json(json_path)
         df = json_to_dataframe(json_data)
+        buffer = io.BytesIO()
+
+        save_dataframe(df, buffer, format="json")
+        self.assertGreater(buffer.tell(), 0)
+
+        # Verify it's valid JSON
+        loaded_data = json.loads(buffer.getvalue())
+        self.assertIsInstance(loaded_data, list)
+
+    def test_save_dataframe_to_json_values(self):
+        """Test JSON output for missing values and timestamps."""
+        df = pd.DataFrame(
+            {
+                "id": [1, 2],
+                "score": [1.5, None],
+                "joined": pd.to_datetime(["2024-01-02", None]),
+            }
+        )
+        buffer = io.BytesIO()
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
+        save_dataframe(df, buffer, format="json")
 
-        try:
-            save_dataframe(df, temp_path, format="json")
-            self.assertTrue(temp_path.exists())
+        self.assertEqual(
+            json.loads(buffer.getvalue()),
+            [
+                {"id": 1, "score": 1.5, "joined": "2024-01-02T00:00:00"},
+                {"id": 2, "score": None, "joined": None},
+            ],
+        )
 
-            # Verify it's valid JSON
-            with open(temp_path, "r") as f:
-                loaded_data = json.load(f)
-            self.assertIsInstance(loaded_data, list)
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+    def test_save_dataframe_to_json_integer_labels(self):
+        """Test JSON output for integer column labels, as from header=None."""
+        df = pd.DataFrame({0: [1, 2], 1: [3, 4]})
+        buffer = io.BytesIO()
+
+        save_dataframe(df, buffer, format="json")
+
+        self.assertEqual(
+            json.loads(buffer.getvalue()), [{"0": 1, "1": 3}, {"0": 2, "1": 4}]
+        )
+
+    def test_save_dataframe_to_json_big_integers(self):
+        """Test JSON output for integers wider than 64 bits and missing values."""
+        df = pd.DataFrame(
+            {"value": pd.Series([10**20, 1], dtype=object), "score": [None, 1.5]}
+        )
+        buffer = io.BytesIO()
+
+        save_dataframe(df, buffer, format="json")
+
+        def reject_constant(token):
+            raise ValueError(f"Invalid JSON token: {token}")
+
+        self.assertEqual(
+            json.loads(buffer.getvalue(), parse_constant=reject_constant),
+            [{"value": 10**20, "score": None}, {"value": 1, "score": 1.5}],
+        )
 
     def test_save_dataframe_invalid_format(self):
         """Test saving with invalid format."""
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = load_csv(DATA_DIR / "sample_data.csv")
+        buffer = io.BytesIO()
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            with self.assertRaises(ValueError):
-                save_dataframe(df, temp_path, format="invalid")
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        with self.assertRaises(ValueError):
+            save_dataframe(df, buffer, format="invalid")
+        self.assertEqual(buffer.tell(), 0)
 
 
-class TestDataParsingIntegration(unittest.TestCase):
+class TestDataParsingIntegration(SharedFramesTestCase):
     """Integration tests combining multiple data parsing functions."""
 
     def test_full_workflow_csv_analysis(self):
         """Test complete workflow: load, filter, aggregate, save."""
-        # Load CSV
-        csv_path = DATA_DIR / "sample_data.csv"
-        df = load_csv(csv_path)
+        df = self.sample_df
         self.assertGreater(len(df), 0)
 
         # Get summary
@@ -422,11 +630,8 @@ class TestDataParsingIntegration(unittest.TestCase):
 
     def test_full_workflow_merge_and_aggregate(self):
         """Test complete workflow: merge DataFrames and aggregate."""
-        # Load both DataFrames
-        employees_path = DATA_DIR / "employees.csv"
-        departments_path = DATA_DIR / "departments.csv"
-        employees_df = load_csv(employees_path)
-        departments_df = load_csv(departments_path)
+        employees_df = self.employees_df
+        departments_df = self.departments_df
 
         # Merge
         merged = merge_dataframes(
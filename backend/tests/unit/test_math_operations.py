@@ -158,6 +158,19 @@ class TestFibonacciFunction(unittest.TestCase):
         expected = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
         self.assertEqual(result, expected)
 
+    def test_fibonacci_result_is_independent_copy(self):
+        """Test that mutating a result does not affect later calls."""
+        result = fibonacci(5)
+        result.append(99)
+        self.assertEqual(fibonacci(5), [0, 1, 1, 2, 3])
+
+    def test_fibonacci_beyond_cache_bound(self):
+        """Test sequences longer than the memoized range."""
+        result = fibonacci(1500)
+        self.assertEqual(len(result), 1500)
+        self.assertEqual(result[:5], [0, 1, 1, 2, 3])
+        self.assertEqual(result[-1], result[-2] + result[-3])
+
     def test_fibonacci_invalid_input(self):
         """Test fibonacci with invalid input."""
         with self.assertRaisesRegex(ValueError, "Input must be a positive integer"):
@@ -199,6 +212,23 @@ class TestIsPrimeFunction(unittest.TestCase):
         self.assertFalse(is_prime(21))
         self.assertFalse(is_prime(100))
 
+    def test_large_numbers(self):
+        """Test with large primes and hard composites."""
+        self.assertTrue(is_prime(1_000_000_007))
+        self.assertTrue(is_prime(2**61 - 1))
+        self.assertFalse(is_prime(2**61 + 1))
+        # Carmichael number and strong pseudoprime to base 2
+        self.assertFalse(is_prime(561))
+        self.assertFalse(is_prime(2047))
+        # Product of two large primes
+        self.assertFalse(is_prime(1_000_000_007 * 998_244_353))
+
+    def test_matches_trial_division(self):
+        """Test agreement with trial division for small numbers."""
+        for n in range(2, 2000):
+            expected = all(n % d for d in range(2, int(n**0.5) + 1))
+            self.assertEqual(is_prime(n), expected, n)
+
     def test_prime_edge_cases(self):
         """Test edge cases for prime checking."""
         with self.assertRaisesRegex(
@@ -288,6 +318,40 @@ class TestCalculateStatsFunction(unittest.TestCase):
         self.assertEqual(result["max"], 3)
         self.assertEqual(result["sum"], 0)
 
+    def test_stats_large_list(self):
+        """Test statistics on lists long enough to use the NumPy path."""
+        numbers = list(range(1000, 0, -1))
+        result = calculate_stats(numbers)
+
+        self.assertEqual(result["count"], 1000)
+        self.assertAlmostEqual(result["mean"], 500.5)
+        self.assertAlmostEqual(result["median"], 500.5)
+        self.assertEqual(result["min"], 1)
+        self.assertEqual(result["max"], 1000)
+        self.assertEqual(result["sum"], 500500)
+        self.assertIsInstance(result["sum"], int)
+        self.assertIsInstance(result["min"], int)
+
+        result = calculate_stats(numbers + [0.5])
+        self.assertEqual(result["median"], 500)
+        self.assertIsInstance(result["median"], int)
+        self.assertEqual(result["min"], 0.5)
+        self.assertAlmostEqual(result["sum"], 500500.5, places=7)
+
+        # NumPy sums floats pairwise, so the last digit may differ from sum()
+        floats = [0.1] * 300
+        result = calculate_stats(floats)
+        self.assertAlmostEqual(result["sum"], sum(floats))
+        self.assertAlmostEqual(result["mean"], sum(floats) / 300)
+
+    def test_stats_large_list_exact_integers(self):
+        """Test that huge integers in long lists are summed exactly."""
+        numbers = [2**62] * 300
+        result = calculate_stats(numbers)
+
+        self.assertEqual(result["sum"], 300 * 2**62)
+        self.assertEqual(result["max"], 2**62)
+
     def test_stats_empty_list(self):
         """Test statistics with empty list."""
         with self.assertRaisesRegex(ValueError, "List cannot be empty"):
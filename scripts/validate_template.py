@@ -15,7 +15,15 @@ import ast
 import os
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Set, Tuple
+
+# Directories never searched for template files
+SKIPPED_DIRS = {"__pycache__", "node_modules", "venv"}
+
+# Byte patterns for the CLI checks, which only need substring presence
+ARGPARSE_PATTERN = b"argparse"
+SRC_IMPORT_PATTERN = b"from src."
+MAIN_DEF_PATTERN = b"def main("
 
 
 class ValidationError(Exception):
@@ -30,6 +38,33 @@ class TemplateValidator:
         self.project_path = project_path
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # Index the project's files with one walk so existence checks are
+        # set lookups instead of a stat() call per candidate path
+        self.present_files = self._index_files()
+        self._ast_cache: Dict[Path, Tuple[str, ast.Module]] = {}
+    
+    def _index_files(self) -> Set[str]:
+        """Return the project's file paths relative to its root, '/'-separated."""
+        present: Set[str] = set()
+        root = str(self.project_path)
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Prune hidden directories (.git, .venv, caches) and build output
+            dirnames[:] = [
+                d for d in dirnames if not d.startswith(".") and d not in SKIPPED_DIRS
+            ]
+            rel_dir = os.path.relpath(dirpath, root)
+            prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+            present.update(prefix + name for name in filenames)
+        return present
+    
+    def _get_ast(self, path: Path) -> Tuple[str, ast.Module]:
+        """Return a file's source and parsed AST, reading each file only once."""
+        cached = self._ast_cache.get(path)
+        if cached is None:
+            content = path.read_text()
+            cached = (content, ast.parse(content))
+            self._ast_cache[path] = cached
+        return cached
     
     def validate(self) -> bool:
         """Run all validation checks."""
@@ -59,8 +94,7 @@ class TemplateValidator:
         ]
         
         for file_path in required_files:
-            full_path = self.project_path / file_path
-            if not full_path.exists():
+            if file_path not in self.present_files:
                 self.errors.append(f"Missing required file: {file_path}")
             else:
                 print(f"  ✓ {file_path}")
@@ -71,14 +105,14 @@ class TemplateValidator:
         
         # Find business logic file (could be math_operations.py or business_logic.py)
         business_logic_files = [
-            self.project_path / "src" / "math_operations.py",
-            self.project_path / "src" / "business_logic.py",
+            "src/math_operations.py",
+            "src/business_logic.py",
         ]
         
         business_logic_file = None
         for file_path in business_logic_files:
-            if file_path.exists():
-                business_logic_file = file_path
+            if file_path in self.present_files:
+                business_logic_file = self.project_path / file_path
                 break
         
         if not business_logic_file:
@@ -89,17 +123,16 @@ class TemplateValidator:
         
         # Check required functions
         try:
-            with open(business_logic_file, 'r') as f:
-                content = f.read()
-                tree = ast.parse(content)
+            _, tree = self._get_ast(business_logic_file)
                 
             required_functions = [
                 'square', 'power', 'factorial', 
                 'fibonacci', 'is_prime', 'calculate_stats'
             ]
             
+            # Only module-level functions matter, so skip function bodies
             defined_functions = [
-                node.name for node in ast.walk(tree)
+                node.name for node in ast.iter_child_nodes(tree)
                 if isinstance(node, ast.FunctionDef)
             ]
             
@@ -119,33 +152,37 @@ class TemplateValidator:
         print("\nChecking API structure...")
         
         app_file = self.project_path / "app.py"
-        if not app_file.exists():
+        if "app.py" not in self.present_files:
             return
         
         try:
-            with open(app_file, 'r') as f:
-                content = f.read()
-                tree = ast.parse(content)
+            _, tree = self._get_ast(app_file)
             
-            # Check for FastAPI import
-            import_modules = [
-                node.module for node in ast.walk(tree)
-                if isinstance(node, ast.ImportFrom) and node.module
-            ]
+            # Collect imports and look for the app instance in one traversal
+            import_modules: Set[str] = set()
+            creates_app = False
+            for node in ast.walk(tree):
+                if isinstance(node, ast.ImportFrom) and node.module:
+                    import_modules.add(node.module)
+                elif isinstance(node, ast.Call):
+                    func = node.func
+                    name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+                    creates_app = creates_app or name == "FastAPI"
             
-            if any('fastapi' in str(module) for module in import_modules):
+            # Check for FastAPI import
+            if any('fastapi' in module for module in import_modules):
                 print("  ✓ FastAPI imported")
             else:
                 self.errors.append("FastAPI not imported in app.py")
             
             # Check for app creation
-            if 'FastAPI(' in content:
+            if creates_app:
                 print("  ✓ FastAPI app instance created")
             else:
                 self.errors.append("FastAPI app instance not found")
             
             # Check for business logic imports
-            if 'from src.' in content:
+            if any(module == "src" or module.startswith("src.") for module in import_modules):
                 print("  ✓ Business logic imported from src/")
             else:
                 self.warnings.append(
@@ -161,21 +198,20 @@ class TemplateValidator:
         print("\nChecking CLI structure...")
         
         cli_file = self.project_path / "cli.py"
-        if not cli_file.exists():
+        if "cli.py" not in self.present_files:
             return
         
         try:
-            with open(cli_file, 'r') as f:
-                content = f.read()
+            content = cli_file.read_bytes()
             
             # Check for argparse
-            if 'argparse' in content:
+            if ARGPARSE_PATTERN in content:
                 print("  ✓ argparse imported")
             else:
                 self.warnings.append("argparse not found in cli.py")
             
             # Check for business logic imports
-            if 'from src.' in content:
+            if SRC_IMPORT_PATTERN in content:
                 print("  ✓ Business logic imported from src/")
             else:
                 self.warnings.append(
@@ -183,7 +219,7 @@ class TemplateValidator:
                 )
             
             # Check for main function
-            if 'def main()' in content:
+            if MAIN_DEF_PATTERN in content:
                 print("  ✓ main() function found")
             else:
                 self.warnings.append("main() function not found in cli.py")
@@ -196,15 +232,15 @@ class TemplateValidator:
         print("\nChecking test structure...")
         
         test_files = [
-            self.project_path / "tests" / "unit" / "test_math_operations.py",
-            self.project_path / "tests" / "integration" / "test_api_integration.py",
-            self.project_path / "tests" / "integration" / "test_cli_integration.py",
+            "tests/unit/test_math_operations.py",
+            "tests/integration/test_api_integration.py",
+            "tests/integration/test_cli_integration.py",
         ]
         
         found_tests = 0
         for test_file in test_files:
-            if test_file.exists():
-                print(f"  ✓ {test_file.relative_to(self.project_path)}")
+            if test_file in self.present_files:
+                print(f"  ✓ {test_file}")
                 found_tests += 1
         
         if found_tests == 0: